@@ -98,7 +98,7 @@ class DICOMM3DPluginClass(DICOMPluginBase):
     
     stlFileName = slicer.dicomDatabase.fileForInstance(uid)
     if stlFileName is None:
-      logging.error('Failed to get the filename from the DICOM database for ' + uid)
+      logging.error('Failed to get the filename from the DICOM database for %s', uid)
       self.cleanup()
       return False
     
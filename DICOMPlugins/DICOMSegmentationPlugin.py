@@ -97,7 +97,7 @@ class DICOMSegmentationPluginClass(DICOMPluginBase):
     # the terminology information for each segment
     segFileName = slicer.dicomDatabase.fileForInstance(uid)
     if segFileName is None:
-      logging.error('Failed to get the filename from the DICOM database for ' + uid)
+      logging.error('Failed to get the filename from the DICOM database for %s', uid)
       self.cleanup()
       return False
 
@@ -143,9 +143,9 @@ class DICOMSegmentationPluginClass(DICOMPluginBase):
 
     with open(metaFileName) as metaFile:
       data = json.load(metaFile)
-      logging.debug('Loaded segmentation metadata from ' + metaFileName)
+      logging.debug('Loaded segmentation metadata from %s', metaFileName)
 
-      logging.debug('number of segmentation files = ' + str(numberOfSegmentations))
+      logging.debug('number of segmentation files = %s', numberOfSegmentations)
       if numberOfSegmentations != len(data["segmentAttributes"]):
         logging.error('Loading failed: Inconsistent number of segments in the descriptor file and on disk')
         return
@@ -485,7 +485,7 @@ class DICOMSegmentationExporter(ModuleLogicMixin):
   def cleanup(self):
     try:
       import shutil
-      logging.debug("Cleaning up temporarily created directory {}".format(self.tempDir))
+      logging.debug("Cleaning up temporarily created directory %s", self.tempDir)
       shutil.rmtree(self.tempDir)
     except AttributeError:
       pass
@@ -585,7 +585,7 @@ class DICOMSegmentationExporter(ModuleLogicMixin):
     if not os.path.exists(segFilePath):
       raise RuntimeError("DICOM Segmentation was not created. Check Error Log for further information.")
 
-    logging.debug("Saved DICOM Segmentation to {}".format(segFilePath))
+    logging.debug("Saved DICOM Segmentation to %s", segFilePath)
     return True
 
   def getSeriesAttributes(self):
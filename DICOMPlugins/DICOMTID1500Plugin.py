@@ -165,9 +165,9 @@ class DICOMTID1500PluginClass(DICOMPluginBase, ModuleLogicMixin):
     # scaling that needs to be applied to the referenced series. Assign
     # referencedSeriesUID from the image series, but load using the RWVM plugin
 
-    logging.debug("before sorting: %s" % loadable.uids)
+    logging.debug("before sorting: %s", loadable.uids)
     sortedUIDs = self.sortReportsByDateTime(loadable.uids)
-    logging.debug("after sorting: %s" % sortedUIDs)
+    logging.debug("after sorting: %s", sortedUIDs)
 
     segPlugin = slicer.modules.dicomPlugins["DICOMSegmentationPlugin"]()
 
@@ -206,7 +206,7 @@ class DICOMTID1500PluginClass(DICOMPluginBase, ModuleLogicMixin):
       try:
         tid1500reader = slicer.modules.tid1500reader
       except AttributeError as exc:
-        logging.debug('Unable to find CLI module tid1500reader, unable to load SR TID1500 object: %s ' % str(exc))
+        logging.debug('Unable to find CLI module tid1500reader, unable to load SR TID1500 object: %s ', exc)
         self.cleanup()
         return False
 
@@ -263,25 +263,25 @@ class DICOMTID1500PluginClass(DICOMPluginBase, ModuleLogicMixin):
         trackingUID = measurement[tagName]
         segment = segments[idx]
         segment.SetTag(tagName, trackingUID)
-        logging.debug("Setting tag '{}' to {} for segment with name {}".format(tagName, trackingUID, segment.GetName()))
+        logging.debug("Setting tag '%s' to %s for segment with name %s", tagName, trackingUID, segment.GetName())
 
   def determineAndApplyRWVMToReferencedSeries(self, loadable, segLoadable):
     rwvmUID = loadable.ReferencedRWVMSeriesInstanceUIDs[0]
-    logging.debug("Looking up series %s from database" % rwvmUID)
+    logging.debug("Looking up series %s from database", rwvmUID)
     rwvmFiles = slicer.dicomDatabase.filesForSeries(rwvmUID)
     if len(rwvmFiles) > 0:
       # consider only the first item on the list - there should be only
       # one anyway, for the cases we are handling at the moment
       rwvmPlugin = slicer.modules.dicomPlugins["DICOMRWVMPlugin"]()
       rwvmFile = rwvmFiles[0]
-      logging.debug("Reading RWVM from " + rwvmFile)
+      logging.debug("Reading RWVM from %s", rwvmFile)
       rwvmDataset = pydicom.read_file(rwvmFile)
       if hasattr(rwvmDataset, "ReferencedSeriesSequence"):
         if hasattr(rwvmDataset.ReferencedSeriesSequence[0], "SeriesInstanceUID"):
           if rwvmDataset.ReferencedSeriesSequence[0].SeriesInstanceUID == segLoadable.referencedSeriesUID:
             logging.debug("SEG references the same image series that is referenced by the RWVM series referenced from "
                           "SR. Will load via RWVM.")
-            logging.debug("Examining " + rwvmFile)
+            logging.debug("Examining %s", rwvmFile)
             rwvmLoadables = rwvmPlugin.examine([[rwvmFile]])
             rwvmPlugin.load(rwvmLoadables[0])
     else:
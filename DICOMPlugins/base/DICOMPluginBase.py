@@ -31,7 +31,7 @@ class DICOMPluginBase(DICOMPlugin):
     if not self.tempDir:
       return
     try:
-      logging.debug("Cleaning up temporarily created directory {}".format(self.tempDir))
+      logging.debug("Cleaning up temporarily created directory %s", self.tempDir)
       shutil.rmtree(self.tempDir)
       self.tempDir = None
     except OSError:
@@ -46,10 +46,10 @@ class DICOMPluginBase(DICOMPlugin):
     for files in fileLists:
       cachedLoadables = self.getCachedLoadables(files)
       if cachedLoadables is not None:
-        logging.debug("%s : Using cached files" % self.__class__.__name__)
+        logging.debug("%s : Using cached files", self.__class__.__name__)
         loadables += cachedLoadables
       else:
-        logging.debug("%s : Caching files" % self.__class__.__name__)
+        logging.debug("%s : Caching files", self.__class__.__name__)
         loadablesForFiles = self.examineFiles(files)
         loadables += loadablesForFiles
         self.cacheLoadables(files, loadablesForFiles)
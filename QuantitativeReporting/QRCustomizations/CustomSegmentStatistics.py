@@ -103,9 +103,9 @@ class CustomSegmentStatisticsLogic(SegmentStatisticsLogic):
     measurements = []
 
     sourceImageSeriesUID = ModuleLogicMixin.getDICOMValue(sourceVolumeNode, "0020,000E")
-    logging.debug("SourceImageSeriesUID: {}".format(sourceImageSeriesUID))
+    logging.debug("SourceImageSeriesUID: %s", sourceImageSeriesUID)
     segmentationSOPInstanceUID = ModuleLogicMixin.getDICOMValue(dcmSegmentationFile, "0008,0018")
-    logging.debug("SegmentationSOPInstanceUID: {}".format(segmentationSOPInstanceUID))
+    logging.debug("SegmentationSOPInstanceUID: %s", segmentationSOPInstanceUID)
 
     for segmentID in self.statistics["SegmentIDs"]:
       if not self.isSegmentValid(segmentID):
@@ -0,0 +1,32 @@
+from __future__ import absolute_import
+import json
+import os
+import types
+
+# Parsed configuration files, keyed by (path, modification time). This module is not executed again when the
+# QuantitativeReporting module is reloaded, so the cache is kept across widget reinstantiations.
+_CONFIG_CACHE = {}
+
+
+def loadConfiguration(path):
+  """Returns the parsed JSON file at path, reading it again only if it has been modified since the last call.
+
+  The returned configuration is shared and therefore read-only (see _freeze).
+  """
+  path = os.path.realpath(path)
+  key = (path, os.path.getmtime(path))
+  config = _CONFIG_CACHE.get(key)
+  if config is None:
+    with open(path) as file:
+      config = _freeze(json.load(file))
+    _CONFIG_CACHE[key] = config
+  return config
+
+
+def _freeze(obj):
+  """Recursively converts dicts into read-only mappings and lists into tuples"""
+  if isinstance(obj, dict):
+    return types.MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+  if isinstance(obj, list):
+    return tuple(_freeze(value) for value in obj)
+  return obj
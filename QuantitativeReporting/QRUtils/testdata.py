@@ -40,7 +40,7 @@ class TestDataLogic(ScriptedLoadableModuleLogic):
     qt.QDir().mkpath(destinationDirectory)
     success = slicer.app.applicationLogic().Unzip(filePath, destinationDirectory)
     if not success:
-      logging.error("Archive %s was NOT unzipped successfully." %  filePath)
+      logging.error("Archive %s was NOT unzipped successfully.", filePath)
     return destinationDirectory
 
   @staticmethod
@@ -56,13 +56,13 @@ class TestDataLogic(ScriptedLoadableModuleLogic):
       filePath = os.path.join(TestDataLogic.DOWNLOAD_DIRECTORY, collection, filename)
       if not os.path.exists(os.path.dirname(filePath)):
         os.makedirs(os.path.dirname(filePath))
-      logging.debug('Saving download %s to %s ' % (filename, filePath))
+      logging.debug('Saving download %s to %s ', filename, filePath)
       if not os.path.exists(filePath) or os.stat(filePath).st_size == 0:
         slicer.util.delayDisplay('Requesting download %s from %s...\n' % (filename, url), 1000)
         urlretrieve(url, filePath)
       expectedOutput = TestDataLogic.getUnzippedDirectoryPath(collection, kind)
       if not os.path.exists(expectedOutput) or not len(os.listdir(expectedOutput)):
-        logging.debug('Unzipping data into %s' % expectedOutput)
+        logging.debug('Unzipping data into %s', expectedOutput)
         downloaded[kind] = TestDataLogic.unzipSampleData(filePath, collection, kind)
       else:
         downloaded[kind] = expectedOutput
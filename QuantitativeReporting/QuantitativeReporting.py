@@ -1,12 +1,16 @@
 from __future__ import absolute_import
 from __future__ import print_function
 
+import bisect
+import concurrent.futures
+import functools
 import json
 import logging
 import os
 
 import ctk
 import pydicom
+import pydicom.tag
 import qt
 import slicer
 import vtkSegmentationCorePython as vtkSegmentationCore
@@ -14,6 +18,7 @@ from DICOMSegmentationPlugin import DICOMSegmentationExporter
 from QRCustomizations.CustomSegmentEditor import CustomSegmentEditorWidget
 from QRCustomizations.CustomSegmentStatistics import CustomSegmentStatisticsParameterEditorDialog
 from QRCustomizations.SegmentEditorAlgorithmTracker import SegmentEditorAlgorithmTracker
+from QRUtils.configuration import loadConfiguration
 from QRUtils.htmlReport import HTMLReportCreator
 from QRUtils.testdata import TestDataLogic
 from SlicerDevelopmentToolboxUtils.buttons import CrosshairButton
@@ -27,6 +32,16 @@ from SlicerDevelopmentToolboxUtils.widgets import CopySegmentBetweenSegmentation
 from SlicerDevelopmentToolboxUtils.widgets import DICOMBasedInformationWatchBox, ImportLabelMapIntoSegmentationWidget
 from slicer.ScriptedLoadableModule import *
 
+_MODULE_DIR = None
+
+
+def _moduleDir():
+    """Returns the directory of the QuantitativeReporting module, resolved once per module import"""
+    global _MODULE_DIR
+    if _MODULE_DIR is None:
+        _MODULE_DIR = os.path.dirname(slicer.util.modulePath('QuantitativeReporting'))
+    return _MODULE_DIR
+
 
 class QuantitativeReporting(ScriptedLoadableModule):
     """Uses ScriptedLoadableModule base class, available at:
@@ -55,34 +70,69 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
     https://github.com/Slicer/Slicer/blob/master/Base/Python/slicer/ScriptedLoadableModule.py
     """
 
+    # set once a Slicer user name is known, so that it does not need to be queried again on every module enter
+    _userNameChecked = False
+
     def __init__(self, parent=None):
         ScriptedLoadableModuleWidget.__init__(self, parent)
-        self.slicerTempDir = slicer.util.tempDirectory()
+        self._slicerTempDir = None
         slicer.mrmlScene.AddObserver(slicer.mrmlScene.EndCloseEvent, self.onSceneClosed)
-        self.modulePath = os.path.dirname(slicer.util.modulePath(self.moduleName))
+        self.modulePath = _moduleDir()
 
-        characteristics_config_path = os.path.join(self.modulePath, 'Resources', 'Configuration', 'characteristics.json')
-        with open(characteristics_config_path) as file:
-            self.characteristics_config = json.load(file)
+        characteristics_config_path = self.resourcePath(os.path.join('Configuration', 'characteristics.json'))
+        self.characteristics_config = loadConfiguration(characteristics_config_path)
+        self._characteristicsIndex = None
 
+        # incremented for every observed segmentation event, part of the statistics cache key
+        self._segmentationEditCount = 0
+        self._statisticsKey = None
         self.delayedAutoUpdateTimer = self.createTimer(
             500,
             self.updateMeasurementsTableAndSegmentationCharacteristics,
             singleShot=True
         )
+        self._connections = []
+        # top level widgets added by this module, deleted upon reload
+        self._ownedWidgets = []
+        # Bursts of refresh requests (e.g. segment events while painting) are coalesced into a single refresh
+        self._uiRefreshTimer = self.createTimer(50, self._doUIRefresh, singleShot=True)
+        self._segmentationChangePending = False
+        # (dock widget, size policy) to restore after updateSizes
+        self._sizePolicyToRestore = None
+        self._dockWidgetContents = None
 
         self.segment_characteristics = {}
-        # This is used for the refresh of segmentation into the characteristics group layout
-        self.last_segments_position_in_characteristics_group = []
+        # keys of segment_characteristics in ascending order, kept in sync in updateSegmentationCharacteristics
+        self._sortedSegmentCharacteristicsKeys = []
+        # This is used for the refresh of segmentation into the characteristics group layout:
+        # {segment label value: (label widget, button widget, button slot, row)}
+        self._characteristicsRows = {}
+        # (label value, name) of the segments currently shown in the characteristics group layout
+        self.last_segments_in_characteristics_group = ()
+
+    def resourcePath(self, filename):
+        return os.path.join(_moduleDir(), 'Resources', filename)
+
+    @property
+    def slicerTempDir(self):
+        if self._slicerTempDir is None:
+            self._slicerTempDir = slicer.util.tempDirectory()
+        return self._slicerTempDir
 
     def __del__(self):
         self.delayedAutoUpdateTimer.stop()
+        self._uiRefreshTimer.stop()
 
     def initializeMembers(self):
         self.tableNode = None
         self.segmentationObservers = []
+        self.segmentationNodeObservers = []
+        self._segmentIDsByRow = None
+        self._observedSegmentationNodeID = None
+        self._referencedVolumeCache = {}
         self.dicomSegmentationExporter = None
         self.segmentStatisticsParameterEditorDialog = None
+        self.metaDataFormDialog = None
 
     def enter(self):
         self._checkUserInformation()
@@ -90,22 +140,26 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
             self._useOrCreateSegmentationNodeAndConfigure()
         self.segmentEditorWidget.editor.masterVolumeNodeChanged.connect(self.onImageVolumeSelected)
         self.segmentEditorWidget.editor.segmentationNodeChanged.connect(self.onSegmentationSelected)
-        qt.QTimer.singleShot(0, lambda: self.updateSizes(self.tabWidget.currentIndex))
+        qt.QTimer.singleShot(0, self._deferredUpdateSizes)
 
     def exit(self):
         self.removeSegmentationObserver()
         self.segmentEditorWidget.editor.masterVolumeNodeChanged.disconnect(self.onImageVolumeSelected)
         self.segmentEditorWidget.editor.segmentationNodeChanged.disconnect(self.onSegmentationSelected)
         # self.removeDICOMBrowser()
-        qt.QTimer.singleShot(0, lambda: self.tabWidget.setCurrentIndex(0))
+        qt.QTimer.singleShot(0, self._deferredResetTab)
 
     def _checkUserInformation(self):
-        if not slicer.app.applicationLogic().GetUserInformation().GetName():
+        if QuantitativeReportingWidget._userNameChecked:
+            return
+        userInformation = slicer.app.applicationLogic().GetUserInformation()
+        if not userInformation.GetName():
             if slicer.util.confirmYesNoDisplay("Slicer user name required to save measurement reports. \n\n"
                                                "Do you want to set it now?"):
                 dialog = TextInformationRequestDialog("User Name:")
                 if dialog.exec_():
-                    slicer.app.applicationLogic().GetUserInformation().SetName(dialog.getValue())
+                    userInformation.SetName(dialog.getValue())
+        QuantitativeReportingWidget._userNameChecked = bool(userInformation.GetName())
 
     def onReload(self):
         self.cleanupUIElements()
@@ -113,6 +167,7 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
         super(QuantitativeReportingWidget, self).onReload()
 
     def onSceneClosed(self, caller, event):
+        self._dockWidgetContents = None
         if self.measurementReportSelector.currentNode():
             self.measurementReportSelector.setCurrentNode(None)
         if hasattr(self, "watchBox"):
@@ -126,35 +181,45 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
         self.initializeMembers()
 
     def removeAllUIElements(self):
-        for child in [c for c in self.parent.children() if not isinstance(c, qt.QVBoxLayout)]:
-            try:
-                child.delete()
-            except AttributeError:
-                pass
+        while self._ownedWidgets:
+            widget = self._ownedWidgets.pop()
+            widget.setParent(None)
+            widget.deleteLater()
 
-    def refreshUIElementsAvailability(self):
-
-        def refresh():
-            self.segmentEditorWidget.editor.masterVolumeNodeSelectorVisible = \
-                self.measurementReportSelector.currentNode() and \
-                not ModuleLogicMixin.getReferencedVolumeFromSegmentationNode(self.segmentEditorWidget.segmentationNode)
-            masterVolume = self.segmentEditorWidget.masterVolumeNode
-            self.importSegmentationCollapsibleButton.enabled = masterVolume is not None
-            if not self.importSegmentationCollapsibleButton.collapsed:
-                self.importSegmentationCollapsibleButton.collapsed = masterVolume is None
-
-            self.importLabelMapCollapsibleButton.enabled = masterVolume is not None
-            if not self.importLabelMapCollapsibleButton.collapsed:
-                self.importLabelMapCollapsibleButton.collapsed = masterVolume is None
-            if not self.tableNode:
-                self.enableReportButtons(False)
-                self.updateMeasurementsTable(triggered=True)
+    def _addOwnedWidget(self, layout, widget):
+        layout.addWidget(widget)
+        self._ownedWidgets.append(widget)
 
-        qt.QTimer.singleShot(0, refresh)
+    def refreshUIElementsAvailability(self):
+        self._uiRefreshTimer.start()
+
+    def _doUIRefresh(self):
+        if self._segmentationChangePending:
+            self._segmentationChangePending = False
+            self._applySegmentationChange()
+        self.segmentEditorWidget.editor.masterVolumeNodeSelectorVisible = \
+            self.measurementReportSelector.currentNode() and \
+            not self._getReferencedVolume(self.segmentEditorWidget.segmentationNode)
+        masterVolume = self.segmentEditorWidget.masterVolumeNode
+        self.importSegmentationCollapsibleButton.enabled = masterVolume is not None
+        if not self.importSegmentationCollapsibleButton.collapsed:
+            self.importSegmentationCollapsibleButton.collapsed = masterVolume is None
+
+        self.importLabelMapCollapsibleButton.enabled = masterVolume is not None
+        if not self.importLabelMapCollapsibleButton.collapsed:
+            self.importLabelMapCollapsibleButton.collapsed = masterVolume is None
+        if not self.tableNode:
+            self.enableReportButtons(False)
+            self.updateMeasurementsTable(triggered=True)
 
     @postCall(refreshUIElementsAvailability)
     def setup(self):
         ScriptedLoadableModuleWidget.setup(self)
+        # widgets added by the base class, e.g. the "Reload & Test" section in developer mode
+        for index in range(self.layout.count()):
+            widget = self.layout.itemAt(index).widget()
+            if widget:
+                self._ownedWidgets.append(widget)
 
         self.initializeMembers()
         self.setupTabBarNavigation()
@@ -164,10 +229,8 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
         self.setupSegmentationsArea()
         self.setupSelectionArea()
         self.setupImportArea()
-        self.mainModuleWidgetLayout.addWidget(self.segmentationGroupBox)
-        self.setupSegmentsCharacteristics()
-        self.setupMeasurementsArea()
-        self.setupActionButtons()
+        self._addOwnedWidget(self.mainModuleWidgetLayout, self.segmentationGroupBox)
+        self.setupReportArea()
 
         self.setupConnections()
         self.layout.addStretch(1)
@@ -175,7 +238,7 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
 
     def setupTabBarNavigation(self):
         self.tabWidget = qt.QTabWidget()
-        self.layout.addWidget(self.tabWidget)
+        self._addOwnedWidget(self.layout, self.tabWidget)
 
         self.mainModuleWidget = qt.QWidget()
 
@@ -199,7 +262,7 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
             WatchBoxAttribute('Reader', 'Reader Name: ',
                               callback=slicer.app.applicationLogic().GetUserInformation().GetName)]
         self.watchBox = DICOMBasedInformationWatchBox(self.watchBoxInformation)
-        self.mainModuleWidgetLayout.addWidget(self.watchBox)
+        self._addOwnedWidget(self.mainModuleWidgetLayout, self.watchBox)
 
     def setupTestArea(self):
         self.testArea = qt.QGroupBox("Test Area")
@@ -208,20 +271,24 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
         self.testAreaLayout.addWidget(self.retrieveTestDataButton)
 
         if self.developerMode:
-            self.mainModuleWidgetLayout.addWidget(self.testArea)
+            self._addOwnedWidget(self.mainModuleWidgetLayout, self.testArea)
+
+    def onRetrieveTestDataButtonClicked(self):
+        self.loadTestData()
 
     def loadTestData(self, collection="MRHead",
                      imageDataType='volume',
                      uid="2.16.840.1.113662.4.4168496325.1025306170.548651188813145058"):
-        if not len(slicer.dicomDatabase.filesForSeries(uid)):
+        if not self._isSeriesInDatabase(uid):
             sampleData = TestDataLogic.downloadAndUnzipSampleData(collection)
             TestDataLogic.importIntoDICOMDatabase(sampleData[imageDataType])
         self.loadSeries(uid)
-        loadedVolumeNodes = slicer.util.getNodesByClass('vtkMRMLScalarVolumeNode')
-        if not loadedVolumeNodes:
+        numberOfVolumeNodes = slicer.mrmlScene.GetNumberOfNodesByClass('vtkMRMLScalarVolumeNode')
+        masterNode = slicer.mrmlScene.GetNthNodeByClass(numberOfVolumeNodes - 1, 'vtkMRMLScalarVolumeNode') \
+            if numberOfVolumeNodes else None
+        if masterNode is None:
             logging.error("No volumes were loaded into Slicer. Canceling.")
             return
-        masterNode = loadedVolumeNodes[-1]
         tableNode = slicer.vtkMRMLTableNode()
         tableNode.SetAttribute("QuantitativeReporting", "Yes")
         slicer.mrmlScene.AddNode(tableNode)
@@ -229,6 +296,15 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
         self.segmentEditorWidget.editor.setMasterVolumeNode(masterNode)
         self.retrieveTestDataButton.enabled = False
 
+    @staticmethod
+    def _isSeriesInDatabase(seriesUID):
+        try:
+            # only ask for a single instance UID instead of the file paths of the whole series
+            return len(slicer.dicomDatabase.instancesForSeries(seriesUID, 1)) > 0
+        except (AttributeError, TypeError, ValueError):
+            # older CTK versions don't provide the hits argument
+            return len(slicer.dicomDatabase.filesForSeries(seriesUID)) > 0
+
     def loadSeriesByFileName(self, filename):
         seriesUID = slicer.dicomDatabase.seriesForFile(filename)
         self.loadSeries(seriesUID)
@@ -253,7 +329,7 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
 
         self.selectionAreaWidgetLayout.addWidget(qt.QLabel("Measurement report"), 0, 0)
         self.selectionAreaWidgetLayout.addWidget(self.measurementReportSelector, 0, 1)
-        self.mainModuleWidgetLayout.addWidget(self.selectionAreaWidget)
+        self._addOwnedWidget(self.mainModuleWidgetLayout, self.selectionAreaWidget)
 
     def setupImportArea(self):
         self.setupImportSegmentation()
@@ -271,7 +347,7 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
         self.segmentImportWidget.addEventObserver(self.segmentImportWidget.SuccessEvent, self.onImportFinished)
         self.segmentImportWidget.segmentationNodeSelectorEnabled = False
         self.importSegmentsCollapsibleLayout.addWidget(self.segmentImportWidget)
-        self.mainModuleWidgetLayout.addWidget(self.importSegmentationCollapsibleButton)
+        self._addOwnedWidget(self.mainModuleWidgetLayout, self.importSegmentationCollapsibleButton)
 
     def setupImportLabelmap(self):
         self.importLabelMapCollapsibleButton = ctk.ctkCollapsibleButton()
@@ -286,7 +362,7 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
                                                    self.onLabelMapImportSuccessful)
         self.labelMapImportWidget.segmentationNodeSelectorVisible = False
         self.importLabelMapCollapsibleLayout.addWidget(self.labelMapImportWidget)
-        self.mainModuleWidgetLayout.addWidget(self.importLabelMapCollapsibleButton)
+        self._addOwnedWidget(self.mainModuleWidgetLayout, self.importLabelMapCollapsibleButton)
 
     def onImportFailed(self, caller, event):
         slicer.util.errorDisplay("Import failed. Check console for details.")
@@ -306,7 +382,7 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
 
         hbox = self.createHLayout([self.redSliceLayoutButton, self.fourUpSliceLayoutButton,
                                    self.fourUpSliceTableViewLayoutButton, self.crosshairButton])
-        self.mainModuleWidgetLayout.addWidget(hbox)
+        self._addOwnedWidget(self.mainModuleWidgetLayout, hbox)
 
     def setupSegmentationsArea(self):
         self.segmentationGroupBox = qt.QGroupBox("Segmentations")
@@ -317,25 +393,24 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
         self.segmentEditorAlgorithmTracker = SegmentEditorAlgorithmTracker()
         self.segmentEditorAlgorithmTracker.setSegmentEditorWidget(self.segmentEditorWidget)
 
-    def setupSegmentsCharacteristics(self):
-        self.characteristicsGroupBox = qt.QGroupBox("Characteristics")
-        self.characteristicsGroupBox.setLayout(qt.QGridLayout())
+    def setupReportArea(self):
+        # The static part of the module panel (characteristics, measurements and report buttons) is loaded in one
+        # go from a Qt Designer file
+        reportAreaWidget = slicer.util.loadUI(self.resourcePath('UI/QuantitativeReporting.ui'))
+        self.ui = slicer.util.childWidgetVariables(reportAreaWidget)
 
-        label_segment = qt.QLabel('Segment')
-        label_characteristics = qt.QLabel('Characteristics')
-
-        self.characteristicsGroupBox.layout().addWidget(label_segment, 0, 0)
-        self.characteristicsGroupBox.layout().addWidget(label_characteristics, 0, 1)
+        self.characteristicsGroupBox = self.ui.characteristicsGroupBox
+        self.setupMeasurementsArea()
+        self.setupActionButtons()
 
-        self.mainModuleWidgetLayout.addWidget(self.characteristicsGroupBox)
+        self._addOwnedWidget(self.mainModuleWidgetLayout, reportAreaWidget)
 
     def setupMeasurementsArea(self):
-        self.measurementsGroupBox = qt.QGroupBox("Measurements")
-        self.measurementsGroupBox.setLayout(qt.QGridLayout())
-        self.tableView = slicer.qMRMLTableView()
-        self.tableView.setMinimumHeight(150)
-        self.tableView.setMaximumHeight(150)
-        self.tableView.setSelectionBehavior(qt.QTableView.SelectRows)
+        self.measurementsGroupBox = self.ui.measurementsGroupBox
+        self.tableView = self.ui.tableView
+        # the border is toggled through the "outdated" property, so that the style sheet is only parsed once
+        self.tableView.setStyleSheet('QTableView[outdated="true"]{border:2px solid red;} '
+                                     'QTableView[outdated="false"]{border:none;}')
 
         if ModuleWidgetMixin.isQtVersionOlder():
             self.tableView.horizontalHeader().setResizeMode(qt.QHeaderView.Stretch)
@@ -343,52 +418,35 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
             self.tableView.horizontalHeader().setSectionResizeMode(qt.QHeaderView.Stretch)
 
         self.fourUpTableView = None
-        self.segmentStatisticsConfigButton = self.createButton("Segment Statistics Parameters")
-
-        self.calculateMeasurementsButton = self.createButton("Calculate Measurements", enabled=False)
-        self.calculateAutomaticallyCheckbox = qt.QCheckBox("Auto Update")
-        self.calculateAutomaticallyCheckbox.checked = True
-
-        self.measurementsGroupBox.layout().addWidget(self.tableView, 0, 0, 1, 2)
-        self.measurementsGroupBox.layout().addWidget(self.segmentStatisticsConfigButton, 1, 0, 1, 2)
-        self.measurementsGroupBox.layout().addWidget(self.calculateMeasurementsButton, 2, 0)
-        self.measurementsGroupBox.layout().addWidget(self.calculateAutomaticallyCheckbox, 2, 1)
-
-        self.mainModuleWidgetLayout.addWidget(self.measurementsGroupBox)
+        self.segmentStatisticsConfigButton = self.ui.segmentStatisticsConfigButton
+        self.calculateMeasurementsButton = self.ui.calculateMeasurementsButton
+        self.calculateAutomaticallyCheckbox = self.ui.calculateAutomaticallyCheckbox
 
     def setupActionButtons(self):
-        self.saveReportButton = self.createButton("Save Report")
-        self.completeReportButton = self.createButton("Complete Report")
-        self.exportToHTMLButton = self.createButton("Export to HTML")
+        self.saveReportButton = self.ui.saveReportButton
+        self.completeReportButton = self.ui.completeReportButton
+        self.exportToHTMLButton = self.ui.exportToHTMLButton
         self.enableReportButtons(False)
-        self.mainModuleWidgetLayout.addWidget(self.createHLayout([self.saveReportButton, self.completeReportButton,
-                                                                  self.exportToHTMLButton]))
-
-    def setupConnections(self, funcName="connect"):
-
-        def setupSelectorConnections():
-            getattr(self.measurementReportSelector, funcName)('currentNodeChanged(vtkMRMLNode*)',
-                                                              self.onMeasurementReportSelected)
-
-        def setupButtonConnections():
-            getattr(self.saveReportButton.clicked, funcName)(self.onSaveReportButtonClicked)
-            getattr(self.completeReportButton.clicked, funcName)(self.onCompleteReportButtonClicked)
-            getattr(self.calculateMeasurementsButton.clicked, funcName)(
-                lambda: self.updateMeasurementsTable(triggered=True))
-            getattr(self.segmentStatisticsConfigButton.clicked, funcName)(self.onEditParameters)
-            getattr(self.exportToHTMLButton.clicked, funcName)(self.onExportToHTMLButtonClicked)
-            getattr(self.retrieveTestDataButton.clicked, funcName)(lambda clicked: self.loadTestData())
-
-        def setupOtherConnections():
-            getattr(self.layoutManager.layoutChanged, funcName)(self.onLayoutChanged)
-            getattr(self.layoutManager.layoutChanged, funcName)(self.setupFourUpTableViewConnection)
-            getattr(self.calculateAutomaticallyCheckbox.toggled, funcName)(self.onCalcAutomaticallyToggled)
-            getattr(self.tableView.selectionModel().selectionChanged, funcName)(self.onSegmentSelectionChanged)
-            getattr(self.tabWidget.currentChanged, funcName)(self.onTabWidgetClicked)
-
-        setupSelectorConnections()
-        setupButtonConnections()
-        setupOtherConnections()
+
+    def setupConnections(self):
+        self.measurementReportSelector.connect('currentNodeChanged(vtkMRMLNode*)', self.onMeasurementReportSelected)
+
+        # keep the exact slots, so that removeConnections disconnects what was connected here
+        self._connections = [
+            (self.saveReportButton.clicked, self.onSaveReportButtonClicked),
+            (self.completeReportButton.clicked, self.onCompleteReportButtonClicked),
+            (self.calculateMeasurementsButton.clicked, self.onCalculateMeasurementsButtonClicked),
+            (self.segmentStatisticsConfigButton.clicked, self.onEditParameters),
+            (self.exportToHTMLButton.clicked, self.onExportToHTMLButtonClicked),
+            (self.retrieveTestDataButton.clicked, self.onRetrieveTestDataButtonClicked),
+            (self.layoutManager.layoutChanged, self.onLayoutChanged),
+            (self.layoutManager.layoutChanged, self.setupFourUpTableViewConnection),
+            (self.calculateAutomaticallyCheckbox.toggled, self.onCalcAutomaticallyToggled),
+            (self.tableView.selectionModel().selectionChanged, self.onSegmentSelectionChanged),
+            (self.tabWidget.currentChanged, self.onTabWidgetClicked)
+        ]
+        for signal, slot in self._connections:
+            signal.connect(slot)
 
     def onEditParameters(self, calculatorName=None):
         """Open dialog box to edit calculator's parameters"""
@@ -397,6 +455,7 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
             self.segmentStatisticsParameterEditorDialog = CustomSegmentStatisticsParameterEditorDialog(
                 segmentStatisticsLogic)
         self.segmentStatisticsParameterEditorDialog.exec_()
+        self._statisticsKey = None
         self.updateMeasurementsTable(triggered=True)
 
     def onExportToHTMLButtonClicked(self):
@@ -411,17 +470,33 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
             slicer.app.layoutManager().parent().parent().hide()
             self.dicomBrowser.open()
 
-        qt.QTimer.singleShot(0, lambda: self.updateSizes(currentIndex))
+        qt.QTimer.singleShot(0, self._deferredUpdateSizes)
+
+    def _deferredUpdateSizes(self):
+        self.updateSizes(self.tabWidget.currentIndex)
+
+    def _deferredResetTab(self):
+        self.tabWidget.setCurrentIndex(0)
 
     def updateSizes(self, index):
-        mainWindow = slicer.util.mainWindow()
-        dockWidget = slicer.util.findChildren(mainWindow, name='dockWidgetContents')[0]
-        tempPolicy = dockWidget.sizePolicy
+        if self._dockWidgetContents is None:
+            self._dockWidgetContents = slicer.util.findChildren(slicer.util.mainWindow(), name='dockWidgetContents')[0]
+        dockWidget = self._dockWidgetContents
+        if self._sizePolicyToRestore is None:
+            self._sizePolicyToRestore = (dockWidget, dockWidget.sizePolicy)
         if index == 0:
             dockWidget.setSizePolicy(qt.QSizePolicy.Maximum, qt.QSizePolicy.Preferred)
-        qt.QTimer.singleShot(0, lambda: dockWidget.setSizePolicy(tempPolicy))
+        qt.QTimer.singleShot(0, self._deferredRestoreSizePolicy)
+
+    def _deferredRestoreSizePolicy(self):
+        if self._sizePolicyToRestore is None:
+            return
+        dockWidget, sizePolicy = self._sizePolicyToRestore
+        self._sizePolicyToRestore = None
+        dockWidget.setSizePolicy(sizePolicy)
 
-    def open_characteristic_window(self, segment_index):
+    def open_characteristic_window(self, segment_index, checked=False):
+        # checked is passed along by QPushButton.clicked
         dialog = CharacteristicsWindow(self.segment_characteristics[segment_index], self.characteristics_config)
         dialog.exec()
 
@@ -431,12 +506,23 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
             self.onSegmentSelected(selectedRow)
 
     def onSegmentSelected(self, index):
-        segmentID = self.segmentEditorWidget.getSegmentIDByIndex(index)
+        segmentID = self._getSegmentIDByRow(index)
         self.segmentEditorWidget.editor.setCurrentSegmentID(segmentID)
         self.selectRowIfNotSelected(self.tableView, index)
         self.selectRowIfNotSelected(self.fourUpTableView, index)
         self.segmentEditorWidget.onSegmentSelected(index)
 
+    def _getSegmentIDByRow(self, row):
+        # the list is only cached while segment list changes are observed (see onSegmentListChanged)
+        segmentIDsByRow = self._segmentIDsByRow
+        if segmentIDsByRow is None:
+            segmentation = self.segmentEditorWidget.segmentation
+            segmentIDsByRow = [segmentation.GetNthSegmentID(i) for i in range(segmentation.GetNumberOfSegments())] \
+                if segmentation else []
+            if self.segmentationObservers:
+                self._segmentIDsByRow = segmentIDsByRow
+        return segmentIDsByRow[row]
+
     def selectRowIfNotSelected(self, tableView, selectedRow):
         if tableView:
             if len(tableView.selectedIndexes()):
@@ -446,10 +532,16 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
                 tableView.selectRow(selectedRow)
 
     def removeConnections(self):
-        self.setupConnections(funcName="disconnect")
+        self.measurementReportSelector.disconnect('currentNodeChanged(vtkMRMLNode*)', self.onMeasurementReportSelected)
+        while self._connections:
+            signal, slot = self._connections.pop()
+            signal.disconnect(slot)
         if self.fourUpTableView:
             self.fourUpTableView.selectionModel().selectionChanged.disconnect(self.onSegmentSelectionChanged)
 
+    def onCalculateMeasurementsButtonClicked(self):
+        self.updateMeasurementsTable(triggered=True)
+
     def onCalcAutomaticallyToggled(self, checked):
         if checked and self.segmentEditorWidget.segmentation is not None:
             self.updateMeasurementsTable(triggered=True)
@@ -460,6 +552,15 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
             while len(self.segmentationObservers):
                 observer = self.segmentationObservers.pop()
                 self.segmentEditorWidget.segmentation.RemoveObserver(observer)
+        while len(self.segmentationNodeObservers):
+            node, observer = self.segmentationNodeObservers.pop()
+            node.RemoveObserver(observer)
+        self._observedSegmentationNodeID = None
+        self._referencedVolumeCache.clear()
+        self._segmentationChangePending = False
+        self._segmentIDsByRow = None
+        # edits made while not observed are not counted, so the cached statistics can no longer be trusted
+        self._statisticsKey = None
 
     def setupFourUpTableViewConnection(self):
         if not self.fourUpTableView and self.layoutManager.layout == self.fourUpSliceTableViewLayoutButton.LAYOUT:
@@ -478,7 +579,7 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
     def onSegmentationSelected(self, node):
         if not node:
             return
-        masterVolume = ModuleLogicMixin.getReferencedVolumeFromSegmentationNode(node)
+        masterVolume = self._getReferencedVolume(node)
         if masterVolume:
             self.initializeWatchBox(masterVolume)
 
@@ -522,7 +623,7 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
 
     def _useOrCreateSegmentationNodeAndConfigure(self):
         segmentationNodeID = self.tableNode.GetAttribute('ReferencedSegmentationNodeID')
-        logging.debug("ReferencedSegmentationNodeID {}".format(segmentationNodeID))
+        logging.debug("ReferencedSegmentationNodeID %s", segmentationNodeID)
         if segmentationNodeID:
             segmentationNode = slicer.mrmlScene.GetNodeByID(segmentationNodeID)
         else:
@@ -557,7 +658,43 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
                               vtkSegmentationCore.vtkSegmentation.RepresentationModified]
 
         for event in segmentationEvents:
-            self.segmentationObservers.append(segNode.AddObserver(event, self.onSegmentationNodeChanged))
+            self.segmentationObservers.append(segNode.AddObserver(event, self.onSegmentationEvent))
+
+        segmentListEvents = [vtkSegmentationCore.vtkSegmentation.SegmentAdded,
+                             vtkSegmentationCore.vtkSegmentation.SegmentRemoved,
+                             vtkSegmentationCore.vtkSegmentation.SegmentsOrderModified]
+        for event in segmentListEvents:
+            self.segmentationObservers.append(segNode.AddObserver(event, self.onSegmentListChanged))
+
+        segmentationNode = self.segmentEditorWidget.segmentationNode
+        referenceEvents = [slicer.vtkMRMLNode.ReferenceAddedEvent,
+                           slicer.vtkMRMLNode.ReferenceModifiedEvent,
+                           slicer.vtkMRMLNode.ReferenceRemovedEvent]
+        for event in referenceEvents:
+            self.segmentationNodeObservers.append(
+                (segmentationNode, segmentationNode.AddObserver(event, self.onSegmentationNodeReferenceChanged)))
+        self._observedSegmentationNodeID = segmentationNode.GetID()
+
+    def onSegmentListChanged(self, caller, event):
+        self._segmentIDsByRow = None
+
+    def onSegmentationNodeReferenceChanged(self, caller, event):
+        self._referencedVolumeCache.pop(caller.GetID(), None)
+
+    def _getReferencedVolume(self, segmentationNode):
+        # references of the observed segmentation node are cached until one of its reference events is invoked
+        if not segmentationNode:
+            return None
+        nodeID = segmentationNode.GetID()
+        if nodeID != self._observedSegmentationNodeID:
+            return ModuleLogicMixin.getReferencedVolumeFromSegmentationNode(segmentationNode)
+        volumeID = self._referencedVolumeCache.get(nodeID)
+        volume = slicer.mrmlScene.GetNodeByID(volumeID) if volumeID else None
+        if volume is None:
+            volume = ModuleLogicMixin.getReferencedVolumeFromSegmentationNode(segmentationNode)
+            if volume:
+                self._referencedVolumeCache[nodeID] = volume.GetID()
+        return volume
 
     def initializeWatchBox(self, node):
         if not node:
@@ -584,12 +721,30 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
     def createNewSegmentationNode(self):
         return slicer.mrmlScene.AddNewNodeByClass("vtkMRMLSegmentationNode")
 
+    def onSegmentationEvent(self, caller, event):
+        # invoked for each segment event, handling is deferred to the next (coalesced) UI refresh
+        self._segmentationEditCount += 1
+        self._segmentationChangePending = True
+        self._uiRefreshTimer.start()
+
     @postCall(refreshUIElementsAvailability)
     def onSegmentationNodeChanged(self, observer=None, caller=None):
+        self._applySegmentationChange()
+
+    def _applySegmentationChange(self):
         if self.segmentImportWidget.busy:
             return
+        segmentation = self.segmentEditorWidget.segmentation
+        if segmentation is None or segmentation.GetNumberOfSegments() == 0:
+            # nothing to measure: clear previous results instead of scheduling the statistics computation
+            self.enableReportButtons(False)
+            self.delayedAutoUpdateTimer.stop()
+            self.setMeasurementsTable(None)
+            if segmentation is not None:
+                self.updateSegmentationCharacteristics()
+            return
         self.enableReportButtons(True)
-        self.tableView.setStyleSheet("QTableView{border:2px solid red;};")
+        self._setMeasurementsTableOutdated(True)
         self.delayedAutoUpdateTimer.start()
         # TODO self.delayedAutoUpdateTimer.start()
         # self.updateMeasurementsTable() # instead use delayed auto update triggered above
@@ -601,64 +756,111 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
     def updateSegmentationCharacteristics(self):
         segments = self.segmentEditorWidget.logic.getVisibleSegments(self.segmentEditorWidget.segmentationNode)
 
-        # To update correctly, remove the last widget and add new ones
-        # We can do this since the widget are not link to characteristics.
-        # The segment IDs are link to the characteristics.
-        for i in self.last_segments_position_in_characteristics_group:
-            self.removeWidgetAtPositionInCharacteristicGroup(i, 0)
-            self.removeWidgetAtPositionInCharacteristicGroup(i, 1)
-
-        self.last_segments_position_in_characteristics_group = []
+        # Nothing to rebuild if the same segments are shown in the same order
+        segments_in_group = tuple((s.GetLabelValue(), s.GetName()) for s in segments)
+        if segments_in_group == self.last_segments_in_characteristics_group:
+            return
+        self.last_segments_in_characteristics_group = segments_in_group
 
         # Remove characteristics from the segment_characteristics when a segment have been deleted.
         # This for loop looks if there is a segment in segment_characteristics that is not in the
         # segment editor.
-        segment_ids = [s.GetLabelValue() for s in segments]
-        new_segment_characteristics = {s: c for s, c in self.segment_characteristics.items() if s in segment_ids}
-        self.segment_characteristics = new_segment_characteristics
+        segment_id_set = {segmentID for segmentID, _ in segments_in_group}
+        self.segment_characteristics = {s: c for s, c in self.segment_characteristics.items() if s in segment_id_set}
+        self._sortedSegmentCharacteristicsKeys = \
+            [s for s in self._sortedSegmentCharacteristicsKeys if s in segment_id_set]
+
+        # Suspend painting while rows are changed and lay the group out once at the end
+        groupBox = self.characteristicsGroupBox
+        groupBox.setUpdatesEnabled(False)
+        signalsBlocked = groupBox.blockSignals(True)
+        try:
+            self._updateCharacteristicsRows(segments, segment_id_set)
+        finally:
+            groupBox.blockSignals(signalsBlocked)
+            groupBox.setUpdatesEnabled(True)
+            groupBox.layout().activate()
+            groupBox.update()
+
+    def _updateCharacteristicsRows(self, segments, segment_id_set):
+        # Only the rows of deleted segments are removed, the others are reused
+        for segmentID in [s for s in self._characteristicsRows if s not in segment_id_set]:
+            segment_label, button, slot, _ = self._characteristicsRows.pop(segmentID)
+            button.clicked.disconnect(slot)
+            self.removeWidgetsFromCharacteristicGroup(segment_label, button)
 
+        layout = self.characteristicsGroupBox.layout()
         for i, segment in enumerate(segments):
-            segment_label = qt.QLabel(segment.GetName())
-            button = qt.QPushButton('Add characteristics')
-
             segmentID = segment.GetLabelValue()
             if segmentID not in self.segment_characteristics:
                 self.segment_characteristics[segmentID] = {}
-
-            # This is weird, but it works (https://stackoverflow.com/a/57167056)
-            button.clicked.connect(lambda _, id_=segmentID: self.open_characteristic_window(id_))
+                bisect.insort(self._sortedSegmentCharacteristicsKeys, segmentID)
 
             position_in_characteristics_group = i + 1
-            self.characteristicsGroupBox.layout().addWidget(segment_label, position_in_characteristics_group, 0)
-            self.characteristicsGroupBox.layout().addWidget(button, position_in_characteristics_group, 1)
-            self.last_segments_position_in_characteristics_group.append(position_in_characteristics_group)
+            if segmentID in self._characteristicsRows:
+                segment_label, button, slot, row = self._characteristicsRows[segmentID]
+                segment_label.setText(segment.GetName())
+                if row == position_in_characteristics_group:
+                    continue
+                layout.removeWidget(segment_label)
+                layout.removeWidget(button)
+            else:
+                segment_label = qt.QLabel(segment.GetName())
+                button = qt.QPushButton('Add characteristics')
+                slot = functools.partial(self.open_characteristic_window, segmentID)
+                button.clicked.connect(slot)
 
-    def removeWidgetAtPositionInCharacteristicGroup(self, row, column):
-        layout = self.characteristicsGroupBox.layout()
-        item = layout.itemAtPosition(row, column)
+            layout.addWidget(segment_label, position_in_characteristics_group, 0)
+            layout.addWidget(button, position_in_characteristics_group, 1)
+            self._characteristicsRows[segmentID] = (segment_label, button, slot, position_in_characteristics_group)
 
-        if item is not None:
-            widget = item.widget()
-            if widget is not None:
-                # Remove the widget from the layout
-                layout.removeWidget(widget)
-                # Optionally delete the widget
-                widget.deleteLater()
+    def removeWidgetsFromCharacteristicGroup(self, *widgets):
+        layout = self.characteristicsGroupBox.layout()
+        for widget in widgets:
+            layout.removeWidget(widget)
+            widget.setParent(None)
+            widget.deleteLater()
 
     def updateMeasurementsTable(self, triggered=False, visibleOnly=False):
         if not self.calculateAutomaticallyCheckbox.checked and not triggered:
-            self.tableView.setStyleSheet("QTableView{border:2px solid red;};")
+            self._setMeasurementsTableOutdated(True)
+            return
+        statisticsKey = self._getStatisticsKey(visibleOnly)
+        if statisticsKey is not None and statisticsKey == self._statisticsKey:
+            # nothing changed since the last computation, the table is up to date
+            self._setMeasurementsTableOutdated(False)
             return
         table = self.segmentEditorWidget.calculateSegmentStatistics(self.tableNode, visibleOnly)
+        self._statisticsKey = statisticsKey
         self.setMeasurementsTable(table)
 
+    def _getStatisticsKey(self, visibleOnly):
+        # Segmentation changes are only tracked through the segmentation observers, so without them nothing is cached
+        segmentationNode = self.segmentEditorWidget.segmentationNode
+        masterVolumeNode = self.segmentEditorWidget.masterVolumeNode
+        if not segmentationNode or not masterVolumeNode or not self.segmentationObservers:
+            return None
+        return (segmentationNode.GetID(), self._segmentationEditCount,
+                masterVolumeNode.GetID(), masterVolumeNode.GetMTime(),
+                self.tableNode.GetID() if self.tableNode else None, visibleOnly,
+                tuple(self.segmentEditorWidget.logic.getSegmentIDs(segmentationNode, True)))
+
+    def _setMeasurementsTableOutdated(self, outdated):
+        if self.tableView.property('outdated') == outdated:
+            return
+        self.tableView.setProperty('outdated', outdated)
+        # re-polish for the style sheet to take the property change into account
+        self.tableView.style().unpolish(self.tableView)
+        self.tableView.style().polish(self.tableView)
+
     def setMeasurementsTable(self, table):
         if table:
             self.tableNode = table
             self.tableNode.SetLocked(True)
             self.tableView.setMRMLTableNode(self.tableNode)
-            self.tableView.setStyleSheet("QTableView{border:none};")
+            self._setMeasurementsTableOutdated(False)
         else:
+            self._statisticsKey = None
             if self.tableNode:
                 self.tableNode.RemoveAllColumns()
             self.tableView.setMRMLTableNode(self.tableNode if self.tableNode else None)
@@ -694,50 +896,74 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
         if not self._metadata:
             return False, "Saving process canceled. Meta-information was not confirmed by user."
         try:
-            dcmSegPath = self.createSEG()
+            # computed once for the whole save process
+            visibleSegments = self.segmentEditorWidget.logic.getVisibleSegments(
+                self.segmentEditorWidget.segmentationNode)
+            dcmSegPath = self.createSEG(visibleSegments)
             dcmSRPath = self.createDICOMSR(dcmSegPath, completed)
             if dcmSegPath and dcmSRPath:
-                indexer = ctk.ctkDICOMIndexer()
-                indexer.addFile(slicer.dicomDatabase, dcmSegPath, "copy")
-                indexer.addFile(slicer.dicomDatabase, dcmSRPath, "copy")
+                self._addFilesToDICOMDatabase([dcmSegPath, dcmSRPath])
         except (RuntimeError, ValueError, AttributeError) as exc:
             return False, exc.args
         finally:
             self.cleanupTemporaryData()
+            self._statisticsKey = None
         return True, None
 
+    @staticmethod
+    def _addFilesToDICOMDatabase(filePaths):
+        indexer = ctk.ctkDICOMIndexer()
+        try:
+            # indexes all files within a single database transaction
+            indexer.addListOfFiles(slicer.dicomDatabase, filePaths, "copy")
+        except (AttributeError, TypeError, ValueError):
+            # indexer without list import support
+            for filePath in filePaths:
+                indexer.addFile(slicer.dicomDatabase, filePath, "copy")
+
     def retrieveMetaDataFromUser(self):
-        settings = qt.QSettings()
-        settings.beginGroup("QuantitativeReporting/GeneralContentInformationDefaults")
-        schema = os.path.join(self.modulePath, 'Resources', 'Validation', 'general_content_schema.json')
-        metaDataFormWidget = FormsDialog([schema], defaultSettings=settings)
-        settings.endGroup()
+        # The form is kept for later saves as long as its content matches the defaults persisted after a confirmed save
+        if not self.metaDataFormDialog:
+            settings = qt.QSettings()
+            settings.beginGroup("QuantitativeReporting/GeneralContentInformationDefaults")
+            schema = self.resourcePath(os.path.join('Validation', 'general_content_schema.json'))
+            self.metaDataFormDialog = FormsDialog([schema], defaultSettings=settings)
+            settings.endGroup()
 
         metadata = None
-        if metaDataFormWidget.exec_():
-            metadata = metaDataFormWidget.getData()
+        if self.metaDataFormDialog.exec_():
+            metadata = self.metaDataFormDialog.getData()
             self._persistEnteredMetaData(metadata)
+        else:
+            # discard unconfirmed edits, the next save starts again from the defaults stored in QSettings
+            self.metaDataFormDialog = None
         return metadata
 
     def _persistEnteredMetaData(self, metadata):
         settings = qt.QSettings()
         settings.beginGroup("QuantitativeReporting/GeneralContentInformationDefaults")
-        for attr in list(metadata.keys()):
-            settings.setValue(attr, metadata[attr])
+        for attr, value in metadata.items():
+            # values that are re-confirmed unchanged are not written again
+            if settings.value(attr) != value:
+                settings.setValue(attr, value)
         settings.endGroup()
+        settings.sync()
 
-    def createSEG(self):
-        self.dicomSegmentationExporter = DICOMSegmentationExporter(self.segmentEditorWidget.segmentationNode)
+    def createSEG(self, visibleSegments=None):
+        segmentationNode = self.segmentEditorWidget.segmentationNode
+        self.dicomSegmentationExporter = DICOMSegmentationExporter(segmentationNode)
         segFilename = "quantitative_reporting_export.SEG" + self.dicomSegmentationExporter.currentDateTime + ".dcm"
         dcmSegmentationPath = os.path.join(self.dicomSegmentationExporter.tempDir, segFilename)
+        if visibleSegments is None:
+            visibleSegments = self.segmentEditorWidget.logic.getVisibleSegments(segmentationNode)
         segmentIDs = None
-        if self.segmentEditorWidget.hiddenSegmentsAvailable():
+        if len(visibleSegments) != segmentationNode.GetSegmentation().GetNumberOfSegments():
             if not slicer.util.confirmYesNoDisplay(
                     "Hidden segments have been found. Do you want to export them as well?"):
                 self.updateMeasurementsTable(visibleOnly=True)
-                visibleSegments = self.segmentEditorWidget.logic.getVisibleSegments(
-                    self.segmentEditorWidget.segmentationNode)
-                segmentIDs = [segment.GetName() for segment in visibleSegments]
+                # the exporter needs a list (it measures and iterates it several times) of segment IDs
+                segmentation = segmentationNode.GetSegmentation()
+                segmentIDs = [segmentation.GetSegmentIdBySegment(segment) for segment in visibleSegments]
         try:
             try:
                 self.dicomSegmentationExporter.export(outputDirectory=os.path.dirname(dcmSegmentationPath),
@@ -748,7 +974,7 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
                 raise ValueError("Missing attributes: %s " % str(exc))
             except DICOMSegmentationExporter.EmptySegmentsFoundError:
                 raise ValueError("Empty segments found. Please make sure that there are no empty segments.")
-            logging.debug("Saved DICOM Segmentation to {}".format(dcmSegmentationPath))
+            logging.debug("Saved DICOM Segmentation to %s", dcmSegmentationPath)
             slicer.dicomDatabase.insert(dcmSegmentationPath)
             logging.info("Added segmentation to DICOM database (%s)", dcmSegmentationPath)
         except (DICOMSegmentationExporter.NoNonEmptySegmentsFoundError, ValueError) as exc:
@@ -768,8 +994,10 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
         data["Measurements"] = \
             self.segmentEditorWidget.logic.segmentStatisticsLogic.generateJSON4DcmSR(referencedSegmentation,
                                                                                      self.segmentEditorWidget.masterVolumeNode)
-        logging.debug("DICOM SR Metadata output:")
-        logging.debug(json.dumps(data, indent=2, separators=(',', ': ')))
+        debugLogging = logging.getLogger().isEnabledFor(logging.DEBUG)
+        if debugLogging:
+            logging.debug("DICOM SR Metadata output:")
+            logging.debug(json.dumps(data, indent=2, separators=(',', ': ')))
 
         metaFilePath = self.saveJSON(data, os.path.join(self.dicomSegmentationExporter.tempDir, "sr_meta.json"))
         outputSRPath = os.path.join(self.dicomSegmentationExporter.tempDir, "sr.dcm")
@@ -779,37 +1007,42 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
                   "imageLibraryDataDir": imageLibraryDataDir,
                   "outputFileName": outputSRPath}
 
-        logging.debug(params)
+        if debugLogging:
+            logging.debug(params)
         cliNode = slicer.cli.run(slicer.modules.tid1500writer, None, params, wait_for_completion=True)
 
         if cliNode.GetStatusString() != 'Completed':
             raise Exception("tid1500writer CLI did not complete cleanly")
 
-        # We look in the SEG dicom dataset and retrieve the segmentation.
-        # The segmentation seems to be simply put in order in the DICOM file.
-        seg_ds = pydicom.dcmread(referencedSegmentation)
-        sorted_segment_characteristics_keys = sorted(self.segment_characteristics)
-        if len(seg_ds.SegmentSequence) != len(sorted_segment_characteristics_keys):
-            raise ValueError(
-                f'Number of segmentation ({len(seg_ds)}) in SEG DICOM != Number of segmentation charateristics ({len(self.segment_characteristics)})'
-            )
-
-        sr_ds = pydicom.dcmread(outputSRPath)
-        # In the DICOM SR TID1500, the 6 element is the place that contains segmentations additional information
-        # Each dataset correspond to a segment.
-        for dataset, key in zip(sr_ds.ContentSequence[5].ContentSequence, sorted_segment_characteristics_keys):
-            for concept_name, choice_label in self.segment_characteristics[key].items():
-                characteristics = _find_characteristics_from_concept_name_and_choice(concept_name, choice_label, self.characteristics_config)
-                if characteristics is None:
-                    continue
-
-                characteristics_ds = create_dataset_from_characteristics(characteristics)
-                dataset.ContentSequence.append(characteristics_ds)
-
-        sr_ds.save_as(outputSRPath)
+        # The characteristics are written into the SR by a worker thread, so that the application keeps repainting
+        # while pydicom reads and writes the files. The worker gets its own copy of the inputs.
+        segment_characteristics = [(key, dict(self.segment_characteristics[key]))
+                                   for key in self._sortedSegmentCharacteristicsKeys]
+        if not any(choice_label != 'N/A'
+                   for _, characteristics in segment_characteristics for choice_label in characteristics.values()):
+            # nothing has been selected, the SR written by tid1500writer is complete
+            return outputSRPath
+        # Timer events are still processed while waiting, the pending updates must not modify the report meanwhile
+        pausedTimers = [timer for timer in (self.delayedAutoUpdateTimer, self._uiRefreshTimer) if timer.isActive()]
+        for timer in pausedTimers:
+            timer.stop()
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(_add_characteristics_to_sr, outputSRPath, referencedSegmentation,
+                                         segment_characteristics, self._getCharacteristicsIndex())
+                _wait_for_future(future)
+                future.result()
+        finally:
+            for timer in pausedTimers:
+                timer.start()
 
         return outputSRPath
 
+    def _getCharacteristicsIndex(self):
+        if self._characteristicsIndex is None:
+            self._characteristicsIndex = _build_characteristics_index(self.characteristics_config)
+        return self._characteristicsIndex
+
     def cleanupTemporaryData(self):
         if self.dicomSegmentationExporter:
             self.dicomSegmentationExporter.cleanup()
@@ -826,8 +1059,10 @@ class QuantitativeReportingWidget(ModuleWidgetMixin, ScriptedLoadableModuleWidge
         return data
 
     def saveJSON(self, data, destination):
-        with open(os.path.join(destination), 'w') as outfile:
-            json.dump(data, outfile, indent=2)
+        # The file is only read by the tid1500writer CLI, so it is written compactly. An indented version of the same
+        # data is logged at debug level.
+        with open(destination, 'w', buffering=1 << 20) as outfile:
+            json.dump(data, outfile, separators=(',', ':'))
         return destination
 
 
@@ -915,17 +1150,18 @@ class CharacteristicsWindow(qt.QDialog):
 
         for i, characteristic in enumerate(characteristics_config):
             char_name = characteristic['ConceptNameCodeSequence']['CodeMeaning']
+            choice_labels = [choice['CodeMeaning'] for choice in characteristic['choices']]
             characteristic_widget = qt.QComboBox()
-            for choice in characteristic['choices']:
-                characteristic_widget.addItem(choice['CodeMeaning'])
+            characteristic_widget.addItems(choice_labels)
+
+            selected_label = self.segment_characteristics.get(char_name)
+            if selected_label in choice_labels:
+                characteristic_widget.setCurrentIndex(choice_labels.index(selected_label))
 
             label_characteristics = qt.QLabel(char_name)
             self.characteristicsGroupBox.layout().addWidget(label_characteristics, i, 0)
             self.characteristicsGroupBox.layout().addWidget(characteristic_widget, i, 1)
 
-            if char_name in self.segment_characteristics:
-                characteristic_widget.setCurrentText(self.segment_characteristics[char_name])
-
             self.characteristic_widgets[char_name] = characteristic_widget
 
         accept_button = qt.QPushButton('OK', self)
@@ -944,45 +1180,88 @@ class CharacteristicsWindow(qt.QDialog):
         self.accept()
 
 
-def _find_characteristics_from_concept_name_and_choice(concept_name, choice_label, characteristics_config):
-    if choice_label == 'N/A':
-        return None  # If nothing have been selected, ignore
+def _add_characteristics_to_sr(outputSRPath, referencedSegmentation, segment_characteristics, characteristics_index):
+    """Adds the segment characteristics to the SR at outputSRPath.
 
-    for i in characteristics_config:
-        if i['ConceptNameCodeSequence']['CodeMeaning'] == concept_name:
-            for j in i['choices']:
-                if j['CodeMeaning'] == choice_label:
-                    return {
-                        'ConceptNameCodeSequence': i['ConceptNameCodeSequence'],
-                        'ConceptCodeSequence': j
-                    }
+    segment_characteristics is a list of (segment label value, {'concept_name': 'choice_label'}), ordered like the
+    segments of referencedSegmentation. Only uses pydicom and the file system, so that it can run in a worker thread.
+    """
+    # We look in the SEG dicom dataset and retrieve the segmentation.
+    # The segmentation seems to be simply put in order in the DICOM file.
+    # Only the SegmentSequence is needed, which avoids reading the (potentially large) pixel data
+    seg_ds = pydicom.dcmread(referencedSegmentation, stop_before_pixels=True,
+                             specific_tags=[pydicom.tag.Tag(0x0062, 0x0002)])
+    if len(seg_ds.SegmentSequence) != len(segment_characteristics):
+        raise ValueError(
+            f'Number of segmentation ({len(seg_ds.SegmentSequence)}) in SEG DICOM != Number of segmentation charateristics ({len(segment_characteristics)})'
+        )
 
-    raise ValueError(f'Concept name code (CodeMeaning={concept_name}) with choices {choice_label} not found')
+    sr_ds = pydicom.dcmread(outputSRPath)
+    # In the DICOM SR TID1500, the 6 element is the place that contains segmentations additional information
+    # Each dataset correspond to a segment.
+    for dataset, (_, segment_characteristic) in zip(sr_ds.ContentSequence[5].ContentSequence, segment_characteristics):
+        characteristics = (
+            _find_characteristics_from_concept_name_and_choice(concept_name, choice_label, characteristics_index)
+            for concept_name, choice_label in segment_characteristic.items()
+        )
+        new_items = [create_dataset_from_characteristics(c) for c in characteristics if c is not None]
+        if new_items:
+            dataset.ContentSequence.extend(new_items)
 
+    sr_ds.save_as(outputSRPath)
 
-def create_dataset_from_characteristics(characteristics_dict):
-    ds = pydicom.Dataset()
 
-    ds.RelationshipType = 'CONTAINS'
-    ds.ValueType = 'CODE'
+def _wait_for_future(future):
+    """Keeps processing paint and timer events, but no user input, until future is done"""
+    while not future.done():
+        slicer.app.processEvents(qt.QEventLoop.ExcludeUserInputEvents)
+        concurrent.futures.wait([future], timeout=0.05)
 
-    concept_name_code_sequence = pydicom.Dataset()
-    concept_name_code_sequence.CodeValue = characteristics_dict['ConceptNameCodeSequence']['CodeValue']
-    concept_name_code_sequence.CodingSchemeDesignator = characteristics_dict['ConceptNameCodeSequence'][
-        'CodingSchemeDesignator']
-    concept_name_code_sequence.CodeMeaning = characteristics_dict['ConceptNameCodeSequence']['CodeMeaning']
-    ds.ConceptNameCodeSequence = [concept_name_code_sequence]
 
-    concept_code_sequence = pydicom.Dataset()
-    concept_code_sequence.CodeValue = characteristics_dict['ConceptCodeSequence']['CodeValue']
-    concept_code_sequence.CodingSchemeDesignator = characteristics_dict['ConceptCodeSequence']['CodingSchemeDesignator']
-    concept_code_sequence.CodeMeaning = characteristics_dict['ConceptCodeSequence']['CodeMeaning']
+def _build_characteristics_index(characteristics_config):
+    """Maps each concept name to its ConceptNameCodeSequence and its choices by CodeMeaning
+    {'concept_name': (concept_name_code_sequence, {'choice_label': choice})}
+    """
+    return {
+        i['ConceptNameCodeSequence']['CodeMeaning']: (i['ConceptNameCodeSequence'],
+                                                      {j['CodeMeaning']: j for j in i['choices']})
+        for i in characteristics_config
+    }
 
-    ds.ConceptCodeSequence = [concept_code_sequence]
 
+def _find_characteristics_from_concept_name_and_choice(concept_name, choice_label, characteristics_index):
+    if choice_label == 'N/A':
+        return None  # If nothing have been selected, ignore
+
+    concept_name_code_sequence, choices = characteristics_index.get(concept_name, (None, {}))
+    choice = choices.get(choice_label)
+    if choice is None:
+        raise ValueError(f'Concept name code (CodeMeaning={concept_name}) with choices {choice_label} not found')
+
+    return {
+        'ConceptNameCodeSequence': concept_name_code_sequence,
+        'ConceptCodeSequence': choice
+    }
+
+
+def create_dataset_from_characteristics(characteristics_dict):
+    # Elements are added with explicit tags and VRs, which avoids pydicom's keyword and VR lookups per attribute
+    ds = pydicom.Dataset()
+    ds.add_new(0x0040A010, 'CS', 'CONTAINS')  # RelationshipType
+    ds.add_new(0x0040A040, 'CS', 'CODE')  # ValueType
+    ds.add_new(0x0040A043, 'SQ', [_create_code_sequence_item(characteristics_dict['ConceptNameCodeSequence'])])
+    ds.add_new(0x0040A168, 'SQ', [_create_code_sequence_item(characteristics_dict['ConceptCodeSequence'])])
     return ds
 
 
+def _create_code_sequence_item(code):
+    item = pydicom.Dataset()
+    item.add_new(0x00080100, 'SH', code['CodeValue'])
+    item.add_new(0x00080102, 'SH', code['CodingSchemeDesignator'])
+    item.add_new(0x00080104, 'LO', code['CodeMeaning'])
+    return item
+
+
 if __name__ == "QuantitativeReportingSlicelet":
     import sys
 
@@ -234,6 +234,56 @@ class QuantitativeReportingTest(ScriptedLoadableModuleTest):
 
       self.delayDisplay('Test passed!')
 
+  def test_statistics_after_editing_outside_of_module(self):
+
+    self.delayDisplay('Starting %s' % inspect.stack()[0][3])
+
+    qrWidget = slicer.modules.QuantitativeReportingWidget
+
+    with DICOMUtils.TemporaryDICOMDatabase(self.dicomDatabaseDir) as db:
+      self.assertTrue(db.isOpen)
+      self.assertEqual(slicer.dicomDatabase, db)
+
+      self.loadTestVolume()
+
+      segmentation = qrWidget.segmentEditorWidget.segmentationNode.GetSegmentation()
+      segmentID = segmentation.GenerateUniqueSegmentID('Tumor')
+      segmentation.AddSegment(self._createSphereSegment('Tumor', 5, [30, 30, -127.7]), segmentID)
+
+      self.delayDisplay('Calculate measurements')
+      qrWidget.updateMeasurementsTable(triggered=True)
+      statisticsLogic = qrWidget.segmentEditorWidget.logic.segmentStatisticsLogic
+      statisticsBefore = dict(statisticsLogic.getStatistics())
+
+      self.delayDisplay('Edit segment outside of QuantitativeReporting')
+      self.layoutManager.selectModule("Data")
+      segmentation.RemoveSegment(segmentID)
+      segmentation.AddSegment(self._createSphereSegment('Tumor', 10, [30, 30, -127.7]), segmentID)
+      self.layoutManager.selectModule("QuantitativeReporting")
+
+      qrWidget.updateMeasurementsTable(triggered=True)
+      self.assertNotEqual(statisticsBefore, dict(statisticsLogic.getStatistics()),
+                          "Measurements were not recalculated after editing the segment outside of the module")
+
+      self.delayDisplay('Save report')
+
+      success, err = qrWidget.saveReport()
+      self.assertTrue(success)
+
+      self.delayDisplay('Test passed!')
+
+  def _createSphereSegment(self, segmentName, radius, center):
+    sphereSource = vtk.vtkSphereSource()
+    sphereSource.SetRadius(radius)
+    sphereSource.SetCenter(*center)
+    sphereSource.Update()
+
+    segment = vtkSegmentationCore.vtkSegment()
+    segment.SetName(segmentName)
+    representationName = vtkSegmentationCore.vtkSegmentationConverter.GetSegmentationClosedSurfaceRepresentationName()
+    segment.AddRepresentation(representationName, sphereSource.GetOutput())
+    return segment
+
   def test_import_labelmap(self):
 
     self.delayDisplay('Starting %s' % inspect.stack()[0][3])